@@ -1,7 +1,7 @@
 import logging
 from collections import Counter
 from itertools import groupby
-from os import path, remove
+from os import path, remove, makedirs
 
 from click import command, argument, option, style, UsageError
 from cloudinary import api
@@ -162,13 +162,19 @@ class SyncDir:
 
         logger.info(f"Downloading {len(files_to_pull)} files from Cloudinary")
         downloads = []
+        local_dirs = set()
         for file in files_to_pull:
             remote_file = self.remote_files[file]
             local_path = path.abspath(path.join(self.local_dir, file))
+            local_dirs.add(path.dirname(local_path))
 
             downloads.append((remote_file, local_path, download_results, download_errors))
 
         try:
+            # many files usually share a handful of folders, create each one only once
+            for local_dir in local_dirs:
+                makedirs(local_dir, exist_ok=True)
+
             run_tasks_concurrently(download_file, downloads, self.concurrent_workers)
         finally:
             self._print_sync_status(download_results, download_errors)
@@ -1,5 +1,5 @@
 import logging
-from os import path, makedirs
+from os import path
 
 import requests
 from click import style, launch
@@ -68,9 +68,11 @@ def upload_file(file_path, options, uploaded=None, failed=None):
 
 
 def download_file(remote_file, local_path, downloaded=None, failed=None):
+    """
+    Downloads the remote file to local_path. The destination folder must be created by the caller.
+    """
     downloaded = downloaded if downloaded is not None else {}
     failed = failed if failed is not None else {}
-    makedirs(path.dirname(local_path), exist_ok=True)
 
     sign_url = True if remote_file['type'] in ("private", "authenticated") else False
 
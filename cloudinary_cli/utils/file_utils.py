@@ -5,7 +5,7 @@ from os.path import split, relpath, abspath
 from pathlib import PurePath
 
 from cloudinary_cli.defaults import logger
-from cloudinary_cli.utils.utils import etag
+from cloudinary_cli.utils.utils import etag, run_cpu_tasks_concurrently
 
 FORMAT_ALIASES = {
     'jpeg': 'jpg',
@@ -40,7 +40,7 @@ FORMAT_ALIASES = {
 
 
 def walk_dir(root_dir, include_hidden=False):
-    all_files = {}
+    file_paths = {}
     for root, dirs, files in walk(root_dir):
         if not include_hidden:
             files = [f for f in files if not is_hidden(root, f)]
@@ -51,11 +51,18 @@ def walk_dir(root_dir, include_hidden=False):
             full_path = path.join(root, file)
             relative_file_path = "/".join(p for p in [relative_path, file] if p)
             normalized_relative_file_path = normalize_file_extension(relative_file_path)
-            all_files[normalized_relative_file_path] = {
-                "path": full_path,
-                "etag": etag(full_path)
-            }
-    return all_files
+            file_paths[normalized_relative_file_path] = full_path
+
+    # hashing is CPU bound, calculate etags in parallel
+    etags = run_cpu_tasks_concurrently(etag, [(full_path,) for full_path in file_paths.values()])
+
+    return {
+        relative_file_path: {
+            "path": full_path,
+            "etag": file_etag
+        }
+        for (relative_file_path, full_path), file_etag in zip(file_paths.items(), etags)
+    }
 
 
 def is_hidden(root, relative_path):
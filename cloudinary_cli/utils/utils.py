@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 import builtins
+import hashlib
 import json
 import os
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from csv import DictWriter
-from functools import reduce
-from hashlib import md5
 from inspect import signature, getfullargspec
+from itertools import chain
 from multiprocessing import pool
 
 import click
@@ -19,7 +20,16 @@ not_callable = ('is_appengine_sandbox', 'call_tags_api', 'call_context_api', 'ca
                 'call_metadata_api', 'call_json_api', 'only', 'transformation_string', 'account_config',
                 'reset_config', 'upload_large_part', 'upload_image', 'upload_resource')
 
-BLOCK_SIZE = 65536
+BLOCK_SIZE = 1 << 20
+CSV_BUFFER_SIZE = 1 << 20
+MIN_CONCURRENT_CPU_TASKS = 16
+
+_BUILTIN_NAMES = frozenset(dir(builtins))
+
+_PARSED_OPTION_VALUES_CACHE_SIZE = 1024
+_parsed_option_values = {}
+
+_JINJA_ENV = Environment(loader=FileSystemLoader(TEMPLATE_FOLDER))
 
 
 class ConfigurationError(Exception):
@@ -27,35 +37,53 @@ class ConfigurationError(Exception):
 
 
 def etag(fi):
-    file_hash = md5()
-    with open(fi, 'rb') as f:
-        fb = f.read(BLOCK_SIZE)
-        while len(fb) > 0:
-            file_hash.update(fb)
-            fb = f.read(BLOCK_SIZE)
+    """
+    Calculates the etag of the local file.
+
+    The result is compared against the etag returned by Cloudinary, which is an MD5 of the asset content,
+    hence a faster hash function (BLAKE3, xxHash, etc) cannot be used here.
+
+    :param fi: The path to the file.
+    :type fi: str
+
+    :return: The MD5 hex digest of the file content.
+    :rtype str
+    """
+    with open(fi, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'md5').hexdigest()
+
+        file_hash = hashlib.md5()
+        buf = bytearray(BLOCK_SIZE)
+        view = memoryview(buf)
+        n = f.readinto(buf)
+        while n:
+            file_hash.update(view[:n])
+            n = f.readinto(buf)
 
     return file_hash.hexdigest()
 
 
 def is_builtin_class_instance(obj):
-    return type(obj).__name__ in dir(builtins)
+    return type(obj).__name__ in _BUILTIN_NAMES
 
 
 def get_help_str(module, block_list=(), allow_list=()):
     funcs = {}
-    for f in module.__dict__.keys():
-        if callable(module.__dict__[f]) \
-                and not is_builtin_class_instance(module.__dict__[f]) \
-                and f[0].islower() \
+    for f, func in module.__dict__.items():
+        # cheap name checks first, the rest only for the matching names
+        if f[0].islower() \
                 and (f not in block_list and block_list) \
-                and (f in allow_list or not allow_list):
-            funcs[f] = {"params": ", ".join(signature(module.__dict__[f]).parameters),
-                        "desc": parse(module.__dict__[f].__doc__).short_description}
+                and (f in allow_list or not allow_list) \
+                and callable(func) \
+                and not is_builtin_class_instance(func):
+            funcs[f] = {"params": ", ".join(signature(func).parameters),
+                        "desc": parse(func.__doc__).short_description}
 
     funcs = OrderedDict(sorted(funcs.items()))
 
     # Gets the max length of the functions' names
-    template = "{0:" + str(len(max(funcs.keys(), key=len)) + 1) + "}({1:30} {2}"
+    template = "{0:" + str(max(len(f) for f in funcs) + 1) + "}({1:30} {2}"
 
     return '\n'.join(
         [
@@ -80,13 +108,12 @@ def load_template(language, template_name):
         logger.error(f"Template: '{template_name}' for language: '{language}' does not exist")
         return False
     try:
-        with open(filepath) as f:
-            template = Environment(loader=FileSystemLoader(TEMPLATE_FOLDER)).from_string(f.read())
+        template = _get_template(language, template_name)
     except IOError:
         logger.error(f"Failed loading template: '{template_name}' for language: '{language}'")
         raise
     try:
-        result = template.render(**cloudinary.config().__dict__)
+        result = template.render(cloudinary.config().__dict__)
     except Exception:
         logger.error(f"Failed rendering template: '{template_name}' for language: '{language}'")
         raise
@@ -94,19 +121,34 @@ def load_template(language, template_name):
     return result
 
 
+def _get_template(language, template_name):
+    return _JINJA_ENV.get_template(f"{language}/{template_name}")
+
+
 def parse_option_value(value):
     if value == "True" or value == "true":
         return True
     elif value == "False" or value == "false":
         return False
+
+    if isinstance(value, str) and value in _parsed_option_values:
+        return _parsed_option_values[value]
+
+    parsed = value
     try:
-        value = json.loads(value)
+        parsed = json.loads(value)
     except Exception:
         pass
     # serialize 0 to "0" string, otherwise it will be omitted (counted as False)
-    if isinstance(value, int) and not value:
-        value = str(value)
-    return value
+    if isinstance(parsed, int) and not parsed:
+        parsed = str(parsed)
+
+    # lists and dicts are not cached, since callers may modify them
+    if not isinstance(parsed, (list, dict)) and isinstance(value, str) \
+            and len(_parsed_option_values) < _PARSED_OPTION_VALUES_CACHE_SIZE:
+        _parsed_option_values[value] = parsed
+
+    return parsed
 
 
 def parse_args_kwargs(func, params):
@@ -139,26 +181,64 @@ def remove_string_prefix(string, prefix):
 
 
 def invert_dict(d):
-    inv_dict = {}
-    for k, v in d.items():
-        inv_dict[v] = k
-
-    return inv_dict
+    return {v: k for k, v in d.items()}
 
 
 def write_json_list_to_csv(json_list, filename, fields_to_keep=()):
-    with open(f'{filename}.csv', 'w') as f:
-        if not fields_to_keep:
-            fields_to_keep = list(reduce(lambda x, y: set(y.keys()) | x, json_list, set()))
+    if not fields_to_keep:
+        # union of all keys, preserving the order they were first seen in
+        fields_to_keep = list(dict.fromkeys(chain.from_iterable(json_list)))
 
-        writer = DictWriter(f, fieldnames=fields_to_keep)
+    with open(f'{filename}.csv', 'w', newline='', buffering=CSV_BUFFER_SIZE, encoding='utf-8') as f:
+        # rows contain only the keys from fields_to_keep, no need to validate each row
+        writer = DictWriter(f, fieldnames=fields_to_keep, extrasaction='ignore')
         writer.writeheader()
         writer.writerows(json_list)
 
 
 def run_tasks_concurrently(func, tasks, concurrent_workers):
-    thread_pool = pool.ThreadPool(concurrent_workers)
-    thread_pool.starmap(func, tasks)
+    errors = []
+
+    def run_task(task):
+        # a failed task must not stop the remaining ones, the first error is raised when all tasks are done
+        try:
+            func(*task)
+        except Exception as e:
+            errors.append(e)
+
+    chunksize = max(1, len(tasks) // (concurrent_workers * 8))
+    with pool.ThreadPool(concurrent_workers) as thread_pool:
+        # consume results as soon as tasks complete, instead of collecting all of them in memory
+        for _ in thread_pool.imap_unordered(run_task, tasks, chunksize=chunksize):
+            pass
+
+    if errors:
+        raise errors[0]
+
+
+def run_cpu_tasks_concurrently(func, tasks, concurrent_workers=None):
+    """
+    Runs CPU bound tasks that release the GIL (like hashing large buffers) in a pool of threads.
+
+    Threads are used rather than processes: hashlib releases the GIL while hashing, and threads avoid
+    the startup (spawn re-imports the CLI on macOS and Windows) and pickling costs of worker processes.
+    Small batches (less than MIN_CONCURRENT_CPU_TASKS tasks) are run sequentially, without creating a pool.
+
+    :param func: The function to run.
+    :param tasks: A list of argument tuples, one per task.
+    :type tasks: list
+    :param concurrent_workers: The maximum number of worker threads, defaults to the number of CPUs.
+    :type concurrent_workers: int
+
+    :return: A list of results, in the order of the tasks.
+    :rtype list
+    """
+    concurrent_workers = min(concurrent_workers or os.cpu_count() or 1, len(tasks))
+    if concurrent_workers <= 1 or len(tasks) < MIN_CONCURRENT_CPU_TASKS:
+        return [func(*task) for task in tasks]
+
+    with ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
+        return list(executor.map(func, *zip(*tasks)))
 
 
 def confirm_action(message="Continue? (y/N)"):
@@ -199,10 +279,10 @@ def get_command_params(
         module,
         module_name):
     method = params[0]
-    if method not in module.__dict__:
-        raise Exception(f"Method {params[0]} does not exist in {module_name.capitalize()}.")
-
-    func = module.__dict__.get(method)
+    try:
+        func = module.__dict__[method]
+    except KeyError:
+        raise Exception(f"Method {params[0]} does not exist in {module_name.capitalize()}.") from None
 
     if not callable(func):
         raise Exception(f"{params[0]} is not callable.")
@@ -211,7 +291,7 @@ def get_command_params(
 
     kwargs = {
         **kwargs,
-        **{k: v for k, v in optional_parameter},
+        **dict(optional_parameter),
         **{k: parse_option_value(v) for k, v in optional_parameter_parsed},
     }
 
@@ -243,18 +323,15 @@ def whitelist_keys(data, keys):
     if not keys or any(not isinstance(i, dict) for i in data):
         return data
 
-    return list(
-        map(lambda x: {
-            k: x[k]
-            for k in keys if k in x},
-            data)
-    )
+    keys = tuple(keys)
+
+    return [{k: x[k] for k in keys if k in x} for x in data]
 
 
 def merge_responses(all_res, paginated_res, fields_to_keep=None, pagination_field=None):
     if not pagination_field:
-        for key in all_res:
-            if all_res[key] != paginated_res.get(key, 0) and type(all_res[key]) == list:
+        for key, value in all_res.items():
+            if type(value) == list and value != paginated_res.get(key, 0):
                 pagination_field = key
 
         if not pagination_field:  # should not happen
@@ -281,14 +358,7 @@ def normalize_list_params(params):
     :return: A list of normalized params.
     :rtype list
     """
-    normalized_params = []
-    for f in list(params):
-        if "," in f:
-            normalized_params += f.split(",")
-        else:
-            normalized_params.append(f)
-
-    return normalized_params
+    return list(chain.from_iterable(f.split(",") for f in params))
 
 
 def chunker(seq, size):
@@ -1,5 +1,9 @@
+import hashlib
+import os
+import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from cloudinary_cli.utils.file_utils import get_destination_folder, walk_dir, normalize_file_extension
 from test.helper_test import RESOURCES_DIR
@@ -24,6 +28,25 @@ class FileUtilsTest(unittest.TestCase):
         self.assertEqual(1, len(walk_dir(test_dir, include_hidden=False)))
         self.assertEqual(4, len(walk_dir(test_dir, include_hidden=True)))
 
+    @patch('cloudinary_cli.utils.utils.os.cpu_count', return_value=4)
+    def test_walk_dir_etags(self, _):
+        """ should calculate etags of many files concurrently and keep them matched to the files """
+        with tempfile.TemporaryDirectory() as test_dir:
+            expected = {}
+            for i in range(20):
+                relative_path = f"d{i % 2}/f{i}.txt"
+                content = f"content {i}".encode()
+                os.makedirs(os.path.join(test_dir, f"d{i % 2}"), exist_ok=True)
+                with open(os.path.join(test_dir, relative_path), "wb") as f:
+                    f.write(content)
+                expected[relative_path] = hashlib.md5(content).hexdigest()
+
+            files = walk_dir(test_dir)
+
+            self.assertDictEqual(expected, {k: v["etag"] for k, v in files.items()})
+            for relative_path, file in files.items():
+                self.assertEqual(os.path.join(test_dir, *relative_path.split("/")), file["path"])
+
     def test_normalize_file_extension(self):
         for value, expected in {
             "sample.jpg": "sample.jpg",
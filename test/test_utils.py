@@ -1,7 +1,7 @@
 import unittest
 
 from cloudinary_cli.utils.utils import parse_option_value, parse_args_kwargs, whitelist_keys, merge_responses, \
-    normalize_list_params, chunker
+    normalize_list_params, chunker, run_cpu_tasks_concurrently, run_tasks_concurrently
 
 
 class UtilsTest(unittest.TestCase):
@@ -21,6 +21,16 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual("0", parse_option_value(0))
         self.assertEqual(1, parse_option_value(1))
 
+    def test_parse_option_value_returns_new_containers(self):
+        """ should not share parsed lists and dicts between calls """
+        parsed_list = parse_option_value('["test","123"]')
+        parsed_list.append("456")
+        self.assertListEqual(["test", "123"], parse_option_value('["test","123"]'))
+
+        parsed_dict = parse_option_value('{"foo":"bar"}')
+        parsed_dict["foo"] = "baz"
+        self.assertDictEqual({"foo": "bar"}, parse_option_value('{"foo":"bar"}'))
+
     def test_parse_args_kwargs(self):
         args, kwargs = parse_args_kwargs(_no_args_test_func, [])
         self.assertEqual(0, len(args))
@@ -95,6 +105,21 @@ class UtilsTest(unittest.TestCase):
         groups = [group for group in chunker(animals, 3)]
         self.assertListEqual([['cat', 'dog', 'rabbit'], ['duck', 'bird', 'cow'], ['gnu', 'fish']], groups)
 
+    def test_run_tasks_concurrently_completes_all_tasks_on_error(self):
+        """ should run all tasks when one of them fails and raise the error at the end """
+        completed = []
+        tasks = [(i, completed) for i in range(200)]
+        with self.assertRaisesRegex(Exception, "task 0 failed"):
+            run_tasks_concurrently(_fail_first_task_func, tasks, 4)
+
+        self.assertListEqual(list(range(1, 200)), sorted(completed))
+
+    def test_run_cpu_tasks_concurrently(self):
+        """ should run tasks concurrently and keep the order of results """
+        tasks = [(i, i) for i in range(20)]
+        self.assertListEqual([i * 2 for i in range(20)], run_cpu_tasks_concurrently(_only_args_sum_func, tasks, 2))
+        self.assertListEqual([], run_cpu_tasks_concurrently(_only_args_sum_func, [], 2))
+
 
 def _no_args_test_func():
     pass
@@ -104,5 +129,15 @@ def _only_args_test_func(arg1, arg2):
     return arg1, arg2
 
 
+def _only_args_sum_func(arg1, arg2):
+    return arg1 + arg2
+
+
+def _fail_first_task_func(task_num, completed):
+    if not task_num:
+        raise Exception("task 0 failed")
+    completed.append(task_num)
+
+
 def _args_kwargs_test_func(arg1, arg2=None):
     return arg1, arg2